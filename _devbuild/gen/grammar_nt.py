@@ -0,0 +1,96 @@
+# This code is generated by pgen2/grammar.py
+
+augassign = 256
+and_expr = 257
+and_test = 258
+arglist = 259
+argument = 260
+arith_expr = 261
+array_item = 262
+atom = 263
+braced_var_sub = 264
+char_literal = 265
+class_item = 266
+class_items = 267
+class_literal = 268
+class_literal_term = 269
+comma_newline = 270
+command_expr = 271
+comp_for = 272
+comp_op = 273
+comparison = 274
+data_params = 275
+dict = 276
+dict_pair = 277
+dq_string = 278
+end_import = 279
+end_outer = 280
+end_stmt = 281
+expr = 282
+factor = 283
+func_item = 284
+func_items = 285
+func_param = 286
+func_params = 287
+import_name = 288
+import_names = 289
+lambdef = 290
+module_item = 291
+name_type = 292
+name_type_list = 293
+named_func = 294
+not_test = 295
+oil_arglist = 296
+oil_expr = 297
+oil_expr_sub = 298
+oil_for = 299
+oil_place_mutation = 300
+oil_proc = 301
+oil_var_decl = 302
+old_sh_array_literal = 303
+or_test = 304
+pat_eggex = 305
+pat_else = 306
+pat_exprs = 307
+place_list = 308
+power = 309
+proc_param = 310
+proc_params = 311
+range_char = 312
+range_expr = 313
+re_alt = 314
+re_atom = 315
+re_flag = 316
+re_flags = 317
+regex = 318
+repeat_op = 319
+repeat_range = 320
+semi_newline = 321
+sh_array_literal = 322
+sh_command_sub = 323
+shift_expr = 324
+simple_var_sub = 325
+splat_expr = 326
+sq_string = 327
+subscript = 328
+subscriptlist = 329
+suite = 330
+tea_class = 331
+tea_data = 332
+tea_enum = 333
+tea_func = 334
+tea_import = 335
+tea_module = 336
+tea_word = 337
+term = 338
+test = 339
+testlist = 340
+testlist_comp = 341
+trailer = 342
+type_expr = 343
+type_expr_list = 344
+variant = 345
+variant_type = 346
+xor_expr = 347
+ysh_case_pat = 348
+ysh_func = 349
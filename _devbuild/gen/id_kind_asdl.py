@@ -0,0 +1,866 @@
+from asdl import pybase
+
+Id_t = int  # type alias for integer
+
+class Id(object):
+  Word_Compound = 1
+  Arith_Semi = 2
+  Arith_Comma = 3
+  Arith_Plus = 4
+  Arith_Minus = 5
+  Arith_Star = 6
+  Arith_Slash = 7
+  Arith_Percent = 8
+  Arith_DPlus = 9
+  Arith_DMinus = 10
+  Arith_DStar = 11
+  Arith_LParen = 12
+  Arith_RParen = 13
+  Arith_LBracket = 14
+  Arith_RBracket = 15
+  Arith_RBrace = 16
+  Arith_QMark = 17
+  Arith_Colon = 18
+  Arith_LessEqual = 19
+  Arith_Less = 20
+  Arith_GreatEqual = 21
+  Arith_Great = 22
+  Arith_DEqual = 23
+  Arith_NEqual = 24
+  Arith_DAmp = 25
+  Arith_DPipe = 26
+  Arith_Bang = 27
+  Arith_DGreat = 28
+  Arith_DLess = 29
+  Arith_Amp = 30
+  Arith_Pipe = 31
+  Arith_Caret = 32
+  Arith_Tilde = 33
+  Arith_Equal = 34
+  Arith_PlusEqual = 35
+  Arith_MinusEqual = 36
+  Arith_StarEqual = 37
+  Arith_SlashEqual = 38
+  Arith_PercentEqual = 39
+  Arith_DGreatEqual = 40
+  Arith_DLessEqual = 41
+  Arith_AmpEqual = 42
+  Arith_PipeEqual = 43
+  Arith_CaretEqual = 44
+  Eof_Real = 45
+  Eof_RParen = 46
+  Eof_Backtick = 47
+  Undefined_Tok = 48
+  Unknown_Tok = 49
+  Unknown_Backslash = 50
+  Unknown_DEqual = 51
+  Eol_Tok = 52
+  Ignored_LineCont = 53
+  Ignored_Space = 54
+  Ignored_Comment = 55
+  WS_Space = 56
+  Lit_Chars = 57
+  Lit_VarLike = 58
+  Lit_ArrayLhsOpen = 59
+  Lit_ArrayLhsClose = 60
+  Lit_Splice = 61
+  Lit_AtLBracket = 62
+  Lit_AtLBraceDot = 63
+  Lit_Other = 64
+  Lit_EscapedChar = 65
+  Lit_RegexMeta = 66
+  Lit_LBracket = 67
+  Lit_RBracket = 68
+  Lit_Star = 69
+  Lit_QMark = 70
+  Lit_LBrace = 71
+  Lit_RBrace = 72
+  Lit_Comma = 73
+  Lit_Equals = 74
+  Lit_Underscore = 75
+  Lit_Dollar = 76
+  Lit_DRightBracket = 77
+  Lit_TildeLike = 78
+  Lit_Pound = 79
+  Lit_TPound = 80
+  Lit_TDot = 81
+  Lit_Slash = 82
+  Lit_Percent = 83
+  Lit_Colon = 84
+  Lit_Digits = 85
+  Lit_At = 86
+  Lit_ArithVarLike = 87
+  Lit_BadBackslash = 88
+  Lit_CompDummy = 89
+  Backtick_Right = 90
+  Backtick_Quoted = 91
+  Backtick_DoubleQuote = 92
+  Backtick_Other = 93
+  History_Op = 94
+  History_Num = 95
+  History_Search = 96
+  History_Other = 97
+  Op_Newline = 98
+  Op_Amp = 99
+  Op_Pipe = 100
+  Op_PipeAmp = 101
+  Op_DAmp = 102
+  Op_DPipe = 103
+  Op_Semi = 104
+  Op_DSemi = 105
+  Op_LParen = 106
+  Op_RParen = 107
+  Op_DLeftParen = 108
+  Op_DRightParen = 109
+  Op_Less = 110
+  Op_Great = 111
+  Op_Bang = 112
+  Op_LBracket = 113
+  Op_RBracket = 114
+  Op_LBrace = 115
+  Op_RBrace = 116
+  Expr_Reserved = 117
+  Expr_Symbol = 118
+  Expr_Name = 119
+  Expr_DecInt = 120
+  Expr_BinInt = 121
+  Expr_OctInt = 122
+  Expr_HexInt = 123
+  Expr_Float = 124
+  Expr_Bang = 125
+  Expr_Dot = 126
+  Expr_DColon = 127
+  Expr_RArrow = 128
+  Expr_RDArrow = 129
+  Expr_DSlash = 130
+  Expr_TEqual = 131
+  Expr_NotDEqual = 132
+  Expr_TildeDEqual = 133
+  Expr_At = 134
+  Expr_DoubleAt = 135
+  Expr_Ellipsis = 136
+  Expr_Dollar = 137
+  Expr_NotTilde = 138
+  Expr_DTilde = 139
+  Expr_NotDTilde = 140
+  Expr_CastedDummy = 141
+  Expr_Null = 142
+  Expr_True = 143
+  Expr_False = 144
+  Expr_And = 145
+  Expr_Or = 146
+  Expr_Not = 147
+  Expr_For = 148
+  Expr_Is = 149
+  Expr_In = 150
+  Expr_If = 151
+  Expr_Else = 152
+  Expr_Func = 153
+  Expr_As = 154
+  Expr_Virtual = 155
+  Expr_Override = 156
+  Expr_Abstract = 157
+  Expr_While = 158
+  Expr_Break = 159
+  Expr_Continue = 160
+  Expr_Return = 161
+  Char_OneChar = 162
+  Char_Stop = 163
+  Char_Hex = 164
+  Char_Octal3 = 165
+  Char_Octal4 = 166
+  Char_Unicode4 = 167
+  Char_Unicode8 = 168
+  Char_UBraced = 169
+  Char_Pound = 170
+  Char_Literals = 171
+  Re_Start = 172
+  Re_End = 173
+  Re_Dot = 174
+  Redir_Less = 175
+  Redir_Great = 176
+  Redir_DLess = 177
+  Redir_TLess = 178
+  Redir_DGreat = 179
+  Redir_GreatAnd = 180
+  Redir_LessAnd = 181
+  Redir_DLessDash = 182
+  Redir_LessGreat = 183
+  Redir_Clobber = 184
+  Redir_AndGreat = 185
+  Redir_AndDGreat = 186
+  Left_DoubleQuote = 187
+  Left_SingleQuote = 188
+  Left_RSingleQuote = 189
+  Left_DollarSingleQuote = 190
+  Left_TDoubleQuote = 191
+  Left_TSingleQuote = 192
+  Left_RTSingleQuote = 193
+  Left_DollarTSingleQuote = 194
+  Left_Backtick = 195
+  Left_DollarParen = 196
+  Left_DollarBrace = 197
+  Left_DollarDParen = 198
+  Left_DollarBracket = 199
+  Left_DollarDoubleQuote = 200
+  Left_ProcSubIn = 201
+  Left_ProcSubOut = 202
+  Left_AtParen = 203
+  Left_CaretParen = 204
+  Left_CaretBracket = 205
+  Left_CaretBrace = 206
+  Left_ColonPipe = 207
+  Left_PercentParen = 208
+  Right_DoubleQuote = 209
+  Right_SingleQuote = 210
+  Right_Backtick = 211
+  Right_DollarBrace = 212
+  Right_DollarDParen = 213
+  Right_DollarDoubleQuote = 214
+  Right_DollarSingleQuote = 215
+  Right_Subshell = 216
+  Right_ShFunction = 217
+  Right_CasePat = 218
+  Right_ShArrayLiteral = 219
+  Right_ExtGlob = 220
+  Right_BlockLiteral = 221
+  ExtGlob_Comma = 222
+  ExtGlob_At = 223
+  ExtGlob_Star = 224
+  ExtGlob_Plus = 225
+  ExtGlob_QMark = 226
+  ExtGlob_Bang = 227
+  VSub_DollarName = 228
+  VSub_Name = 229
+  VSub_Number = 230
+  VSub_Bang = 231
+  VSub_At = 232
+  VSub_Pound = 233
+  VSub_Dollar = 234
+  VSub_Star = 235
+  VSub_Hyphen = 236
+  VSub_QMark = 237
+  VSub_Dot = 238
+  VTest_ColonHyphen = 239
+  VTest_Hyphen = 240
+  VTest_ColonEquals = 241
+  VTest_Equals = 242
+  VTest_ColonQMark = 243
+  VTest_QMark = 244
+  VTest_ColonPlus = 245
+  VTest_Plus = 246
+  VOp0_Q = 247
+  VOp0_E = 248
+  VOp0_P = 249
+  VOp0_A = 250
+  VOp0_a = 251
+  VOp1_Percent = 252
+  VOp1_DPercent = 253
+  VOp1_Pound = 254
+  VOp1_DPound = 255
+  VOp1_Caret = 256
+  VOp1_DCaret = 257
+  VOp1_Comma = 258
+  VOp1_DComma = 259
+  VOpOil_Pipe = 260
+  VOpOil_Space = 261
+  VOp2_Slash = 262
+  VOp2_Colon = 263
+  VOp2_LBracket = 264
+  VOp2_RBracket = 265
+  VOp3_At = 266
+  VOp3_Star = 267
+  Node_PostDPlus = 268
+  Node_PostDMinus = 269
+  Node_UnaryPlus = 270
+  Node_UnaryMinus = 271
+  Node_NotIn = 272
+  Node_IsNot = 273
+  KW_DLeftBracket = 274
+  KW_Bang = 275
+  KW_For = 276
+  KW_While = 277
+  KW_Until = 278
+  KW_Do = 279
+  KW_Done = 280
+  KW_In = 281
+  KW_Case = 282
+  KW_Esac = 283
+  KW_If = 284
+  KW_Fi = 285
+  KW_Then = 286
+  KW_Else = 287
+  KW_Elif = 288
+  KW_Function = 289
+  KW_Time = 290
+  KW_Const = 291
+  KW_Var = 292
+  KW_SetVar = 293
+  KW_SetRef = 294
+  KW_SetGlobal = 295
+  KW_Proc = 296
+  KW_Func = 297
+  KW_Data = 298
+  KW_Enum = 299
+  KW_Class = 300
+  KW_Import = 301
+  ControlFlow_Break = 302
+  ControlFlow_Continue = 303
+  ControlFlow_Return = 304
+  ControlFlow_Exit = 305
+  LookAhead_FuncParens = 306
+  Glob_LBracket = 307
+  Glob_RBracket = 308
+  Glob_Star = 309
+  Glob_QMark = 310
+  Glob_Bang = 311
+  Glob_Caret = 312
+  Glob_EscapedChar = 313
+  Glob_BadBackslash = 314
+  Glob_CleanLiterals = 315
+  Glob_OtherLiteral = 316
+  Format_EscapedPercent = 317
+  Format_Percent = 318
+  Format_Flag = 319
+  Format_Num = 320
+  Format_Dot = 321
+  Format_Type = 322
+  Format_Star = 323
+  Format_Time = 324
+  Format_Zero = 325
+  PS_Subst = 326
+  PS_Octal3 = 327
+  PS_LBrace = 328
+  PS_RBrace = 329
+  PS_Literals = 330
+  PS_BadBackslash = 331
+  Range_Int = 332
+  Range_Char = 333
+  Range_Dots = 334
+  Range_Other = 335
+  QSN_LiteralBytes = 336
+  QSN_SpecialByte = 337
+  QSN_Begin2 = 338
+  QSN_Begin3 = 339
+  QSN_Begin4 = 340
+  QSN_Cont = 341
+  BoolUnary_z = 342
+  BoolUnary_n = 343
+  BoolUnary_o = 344
+  BoolUnary_t = 345
+  BoolUnary_v = 346
+  BoolUnary_R = 347
+  BoolUnary_a = 348
+  BoolUnary_b = 349
+  BoolUnary_c = 350
+  BoolUnary_d = 351
+  BoolUnary_e = 352
+  BoolUnary_f = 353
+  BoolUnary_g = 354
+  BoolUnary_h = 355
+  BoolUnary_k = 356
+  BoolUnary_L = 357
+  BoolUnary_p = 358
+  BoolUnary_r = 359
+  BoolUnary_s = 360
+  BoolUnary_S = 361
+  BoolUnary_u = 362
+  BoolUnary_w = 363
+  BoolUnary_x = 364
+  BoolUnary_O = 365
+  BoolUnary_G = 366
+  BoolUnary_N = 367
+  BoolBinary_GlobEqual = 368
+  BoolBinary_GlobDEqual = 369
+  BoolBinary_GlobNEqual = 370
+  BoolBinary_EqualTilde = 371
+  BoolBinary_ef = 372
+  BoolBinary_nt = 373
+  BoolBinary_ot = 374
+  BoolBinary_eq = 375
+  BoolBinary_ne = 376
+  BoolBinary_gt = 377
+  BoolBinary_ge = 378
+  BoolBinary_lt = 379
+  BoolBinary_le = 380
+  BoolBinary_Equal = 381
+  BoolBinary_DEqual = 382
+  BoolBinary_NEqual = 383
+  ARRAY_SIZE = 384
+
+_Id_str = {
+  1: 'Id.Word_Compound',
+  2: 'Id.Arith_Semi',
+  3: 'Id.Arith_Comma',
+  4: 'Id.Arith_Plus',
+  5: 'Id.Arith_Minus',
+  6: 'Id.Arith_Star',
+  7: 'Id.Arith_Slash',
+  8: 'Id.Arith_Percent',
+  9: 'Id.Arith_DPlus',
+  10: 'Id.Arith_DMinus',
+  11: 'Id.Arith_DStar',
+  12: 'Id.Arith_LParen',
+  13: 'Id.Arith_RParen',
+  14: 'Id.Arith_LBracket',
+  15: 'Id.Arith_RBracket',
+  16: 'Id.Arith_RBrace',
+  17: 'Id.Arith_QMark',
+  18: 'Id.Arith_Colon',
+  19: 'Id.Arith_LessEqual',
+  20: 'Id.Arith_Less',
+  21: 'Id.Arith_GreatEqual',
+  22: 'Id.Arith_Great',
+  23: 'Id.Arith_DEqual',
+  24: 'Id.Arith_NEqual',
+  25: 'Id.Arith_DAmp',
+  26: 'Id.Arith_DPipe',
+  27: 'Id.Arith_Bang',
+  28: 'Id.Arith_DGreat',
+  29: 'Id.Arith_DLess',
+  30: 'Id.Arith_Amp',
+  31: 'Id.Arith_Pipe',
+  32: 'Id.Arith_Caret',
+  33: 'Id.Arith_Tilde',
+  34: 'Id.Arith_Equal',
+  35: 'Id.Arith_PlusEqual',
+  36: 'Id.Arith_MinusEqual',
+  37: 'Id.Arith_StarEqual',
+  38: 'Id.Arith_SlashEqual',
+  39: 'Id.Arith_PercentEqual',
+  40: 'Id.Arith_DGreatEqual',
+  41: 'Id.Arith_DLessEqual',
+  42: 'Id.Arith_AmpEqual',
+  43: 'Id.Arith_PipeEqual',
+  44: 'Id.Arith_CaretEqual',
+  45: 'Id.Eof_Real',
+  46: 'Id.Eof_RParen',
+  47: 'Id.Eof_Backtick',
+  48: 'Id.Undefined_Tok',
+  49: 'Id.Unknown_Tok',
+  50: 'Id.Unknown_Backslash',
+  51: 'Id.Unknown_DEqual',
+  52: 'Id.Eol_Tok',
+  53: 'Id.Ignored_LineCont',
+  54: 'Id.Ignored_Space',
+  55: 'Id.Ignored_Comment',
+  56: 'Id.WS_Space',
+  57: 'Id.Lit_Chars',
+  58: 'Id.Lit_VarLike',
+  59: 'Id.Lit_ArrayLhsOpen',
+  60: 'Id.Lit_ArrayLhsClose',
+  61: 'Id.Lit_Splice',
+  62: 'Id.Lit_AtLBracket',
+  63: 'Id.Lit_AtLBraceDot',
+  64: 'Id.Lit_Other',
+  65: 'Id.Lit_EscapedChar',
+  66: 'Id.Lit_RegexMeta',
+  67: 'Id.Lit_LBracket',
+  68: 'Id.Lit_RBracket',
+  69: 'Id.Lit_Star',
+  70: 'Id.Lit_QMark',
+  71: 'Id.Lit_LBrace',
+  72: 'Id.Lit_RBrace',
+  73: 'Id.Lit_Comma',
+  74: 'Id.Lit_Equals',
+  75: 'Id.Lit_Underscore',
+  76: 'Id.Lit_Dollar',
+  77: 'Id.Lit_DRightBracket',
+  78: 'Id.Lit_TildeLike',
+  79: 'Id.Lit_Pound',
+  80: 'Id.Lit_TPound',
+  81: 'Id.Lit_TDot',
+  82: 'Id.Lit_Slash',
+  83: 'Id.Lit_Percent',
+  84: 'Id.Lit_Colon',
+  85: 'Id.Lit_Digits',
+  86: 'Id.Lit_At',
+  87: 'Id.Lit_ArithVarLike',
+  88: 'Id.Lit_BadBackslash',
+  89: 'Id.Lit_CompDummy',
+  90: 'Id.Backtick_Right',
+  91: 'Id.Backtick_Quoted',
+  92: 'Id.Backtick_DoubleQuote',
+  93: 'Id.Backtick_Other',
+  94: 'Id.History_Op',
+  95: 'Id.History_Num',
+  96: 'Id.History_Search',
+  97: 'Id.History_Other',
+  98: 'Id.Op_Newline',
+  99: 'Id.Op_Amp',
+  100: 'Id.Op_Pipe',
+  101: 'Id.Op_PipeAmp',
+  102: 'Id.Op_DAmp',
+  103: 'Id.Op_DPipe',
+  104: 'Id.Op_Semi',
+  105: 'Id.Op_DSemi',
+  106: 'Id.Op_LParen',
+  107: 'Id.Op_RParen',
+  108: 'Id.Op_DLeftParen',
+  109: 'Id.Op_DRightParen',
+  110: 'Id.Op_Less',
+  111: 'Id.Op_Great',
+  112: 'Id.Op_Bang',
+  113: 'Id.Op_LBracket',
+  114: 'Id.Op_RBracket',
+  115: 'Id.Op_LBrace',
+  116: 'Id.Op_RBrace',
+  117: 'Id.Expr_Reserved',
+  118: 'Id.Expr_Symbol',
+  119: 'Id.Expr_Name',
+  120: 'Id.Expr_DecInt',
+  121: 'Id.Expr_BinInt',
+  122: 'Id.Expr_OctInt',
+  123: 'Id.Expr_HexInt',
+  124: 'Id.Expr_Float',
+  125: 'Id.Expr_Bang',
+  126: 'Id.Expr_Dot',
+  127: 'Id.Expr_DColon',
+  128: 'Id.Expr_RArrow',
+  129: 'Id.Expr_RDArrow',
+  130: 'Id.Expr_DSlash',
+  131: 'Id.Expr_TEqual',
+  132: 'Id.Expr_NotDEqual',
+  133: 'Id.Expr_TildeDEqual',
+  134: 'Id.Expr_At',
+  135: 'Id.Expr_DoubleAt',
+  136: 'Id.Expr_Ellipsis',
+  137: 'Id.Expr_Dollar',
+  138: 'Id.Expr_NotTilde',
+  139: 'Id.Expr_DTilde',
+  140: 'Id.Expr_NotDTilde',
+  141: 'Id.Expr_CastedDummy',
+  142: 'Id.Expr_Null',
+  143: 'Id.Expr_True',
+  144: 'Id.Expr_False',
+  145: 'Id.Expr_And',
+  146: 'Id.Expr_Or',
+  147: 'Id.Expr_Not',
+  148: 'Id.Expr_For',
+  149: 'Id.Expr_Is',
+  150: 'Id.Expr_In',
+  151: 'Id.Expr_If',
+  152: 'Id.Expr_Else',
+  153: 'Id.Expr_Func',
+  154: 'Id.Expr_As',
+  155: 'Id.Expr_Virtual',
+  156: 'Id.Expr_Override',
+  157: 'Id.Expr_Abstract',
+  158: 'Id.Expr_While',
+  159: 'Id.Expr_Break',
+  160: 'Id.Expr_Continue',
+  161: 'Id.Expr_Return',
+  162: 'Id.Char_OneChar',
+  163: 'Id.Char_Stop',
+  164: 'Id.Char_Hex',
+  165: 'Id.Char_Octal3',
+  166: 'Id.Char_Octal4',
+  167: 'Id.Char_Unicode4',
+  168: 'Id.Char_Unicode8',
+  169: 'Id.Char_UBraced',
+  170: 'Id.Char_Pound',
+  171: 'Id.Char_Literals',
+  172: 'Id.Re_Start',
+  173: 'Id.Re_End',
+  174: 'Id.Re_Dot',
+  175: 'Id.Redir_Less',
+  176: 'Id.Redir_Great',
+  177: 'Id.Redir_DLess',
+  178: 'Id.Redir_TLess',
+  179: 'Id.Redir_DGreat',
+  180: 'Id.Redir_GreatAnd',
+  181: 'Id.Redir_LessAnd',
+  182: 'Id.Redir_DLessDash',
+  183: 'Id.Redir_LessGreat',
+  184: 'Id.Redir_Clobber',
+  185: 'Id.Redir_AndGreat',
+  186: 'Id.Redir_AndDGreat',
+  187: 'Id.Left_DoubleQuote',
+  188: 'Id.Left_SingleQuote',
+  189: 'Id.Left_RSingleQuote',
+  190: 'Id.Left_DollarSingleQuote',
+  191: 'Id.Left_TDoubleQuote',
+  192: 'Id.Left_TSingleQuote',
+  193: 'Id.Left_RTSingleQuote',
+  194: 'Id.Left_DollarTSingleQuote',
+  195: 'Id.Left_Backtick',
+  196: 'Id.Left_DollarParen',
+  197: 'Id.Left_DollarBrace',
+  198: 'Id.Left_DollarDParen',
+  199: 'Id.Left_DollarBracket',
+  200: 'Id.Left_DollarDoubleQuote',
+  201: 'Id.Left_ProcSubIn',
+  202: 'Id.Left_ProcSubOut',
+  203: 'Id.Left_AtParen',
+  204: 'Id.Left_CaretParen',
+  205: 'Id.Left_CaretBracket',
+  206: 'Id.Left_CaretBrace',
+  207: 'Id.Left_ColonPipe',
+  208: 'Id.Left_PercentParen',
+  209: 'Id.Right_DoubleQuote',
+  210: 'Id.Right_SingleQuote',
+  211: 'Id.Right_Backtick',
+  212: 'Id.Right_DollarBrace',
+  213: 'Id.Right_DollarDParen',
+  214: 'Id.Right_DollarDoubleQuote',
+  215: 'Id.Right_DollarSingleQuote',
+  216: 'Id.Right_Subshell',
+  217: 'Id.Right_ShFunction',
+  218: 'Id.Right_CasePat',
+  219: 'Id.Right_ShArrayLiteral',
+  220: 'Id.Right_ExtGlob',
+  221: 'Id.Right_BlockLiteral',
+  222: 'Id.ExtGlob_Comma',
+  223: 'Id.ExtGlob_At',
+  224: 'Id.ExtGlob_Star',
+  225: 'Id.ExtGlob_Plus',
+  226: 'Id.ExtGlob_QMark',
+  227: 'Id.ExtGlob_Bang',
+  228: 'Id.VSub_DollarName',
+  229: 'Id.VSub_Name',
+  230: 'Id.VSub_Number',
+  231: 'Id.VSub_Bang',
+  232: 'Id.VSub_At',
+  233: 'Id.VSub_Pound',
+  234: 'Id.VSub_Dollar',
+  235: 'Id.VSub_Star',
+  236: 'Id.VSub_Hyphen',
+  237: 'Id.VSub_QMark',
+  238: 'Id.VSub_Dot',
+  239: 'Id.VTest_ColonHyphen',
+  240: 'Id.VTest_Hyphen',
+  241: 'Id.VTest_ColonEquals',
+  242: 'Id.VTest_Equals',
+  243: 'Id.VTest_ColonQMark',
+  244: 'Id.VTest_QMark',
+  245: 'Id.VTest_ColonPlus',
+  246: 'Id.VTest_Plus',
+  247: 'Id.VOp0_Q',
+  248: 'Id.VOp0_E',
+  249: 'Id.VOp0_P',
+  250: 'Id.VOp0_A',
+  251: 'Id.VOp0_a',
+  252: 'Id.VOp1_Percent',
+  253: 'Id.VOp1_DPercent',
+  254: 'Id.VOp1_Pound',
+  255: 'Id.VOp1_DPound',
+  256: 'Id.VOp1_Caret',
+  257: 'Id.VOp1_DCaret',
+  258: 'Id.VOp1_Comma',
+  259: 'Id.VOp1_DComma',
+  260: 'Id.VOpOil_Pipe',
+  261: 'Id.VOpOil_Space',
+  262: 'Id.VOp2_Slash',
+  263: 'Id.VOp2_Colon',
+  264: 'Id.VOp2_LBracket',
+  265: 'Id.VOp2_RBracket',
+  266: 'Id.VOp3_At',
+  267: 'Id.VOp3_Star',
+  268: 'Id.Node_PostDPlus',
+  269: 'Id.Node_PostDMinus',
+  270: 'Id.Node_UnaryPlus',
+  271: 'Id.Node_UnaryMinus',
+  272: 'Id.Node_NotIn',
+  273: 'Id.Node_IsNot',
+  274: 'Id.KW_DLeftBracket',
+  275: 'Id.KW_Bang',
+  276: 'Id.KW_For',
+  277: 'Id.KW_While',
+  278: 'Id.KW_Until',
+  279: 'Id.KW_Do',
+  280: 'Id.KW_Done',
+  281: 'Id.KW_In',
+  282: 'Id.KW_Case',
+  283: 'Id.KW_Esac',
+  284: 'Id.KW_If',
+  285: 'Id.KW_Fi',
+  286: 'Id.KW_Then',
+  287: 'Id.KW_Else',
+  288: 'Id.KW_Elif',
+  289: 'Id.KW_Function',
+  290: 'Id.KW_Time',
+  291: 'Id.KW_Const',
+  292: 'Id.KW_Var',
+  293: 'Id.KW_SetVar',
+  294: 'Id.KW_SetRef',
+  295: 'Id.KW_SetGlobal',
+  296: 'Id.KW_Proc',
+  297: 'Id.KW_Func',
+  298: 'Id.KW_Data',
+  299: 'Id.KW_Enum',
+  300: 'Id.KW_Class',
+  301: 'Id.KW_Import',
+  302: 'Id.ControlFlow_Break',
+  303: 'Id.ControlFlow_Continue',
+  304: 'Id.ControlFlow_Return',
+  305: 'Id.ControlFlow_Exit',
+  306: 'Id.LookAhead_FuncParens',
+  307: 'Id.Glob_LBracket',
+  308: 'Id.Glob_RBracket',
+  309: 'Id.Glob_Star',
+  310: 'Id.Glob_QMark',
+  311: 'Id.Glob_Bang',
+  312: 'Id.Glob_Caret',
+  313: 'Id.Glob_EscapedChar',
+  314: 'Id.Glob_BadBackslash',
+  315: 'Id.Glob_CleanLiterals',
+  316: 'Id.Glob_OtherLiteral',
+  317: 'Id.Format_EscapedPercent',
+  318: 'Id.Format_Percent',
+  319: 'Id.Format_Flag',
+  320: 'Id.Format_Num',
+  321: 'Id.Format_Dot',
+  322: 'Id.Format_Type',
+  323: 'Id.Format_Star',
+  324: 'Id.Format_Time',
+  325: 'Id.Format_Zero',
+  326: 'Id.PS_Subst',
+  327: 'Id.PS_Octal3',
+  328: 'Id.PS_LBrace',
+  329: 'Id.PS_RBrace',
+  330: 'Id.PS_Literals',
+  331: 'Id.PS_BadBackslash',
+  332: 'Id.Range_Int',
+  333: 'Id.Range_Char',
+  334: 'Id.Range_Dots',
+  335: 'Id.Range_Other',
+  336: 'Id.QSN_LiteralBytes',
+  337: 'Id.QSN_SpecialByte',
+  338: 'Id.QSN_Begin2',
+  339: 'Id.QSN_Begin3',
+  340: 'Id.QSN_Begin4',
+  341: 'Id.QSN_Cont',
+  342: 'Id.BoolUnary_z',
+  343: 'Id.BoolUnary_n',
+  344: 'Id.BoolUnary_o',
+  345: 'Id.BoolUnary_t',
+  346: 'Id.BoolUnary_v',
+  347: 'Id.BoolUnary_R',
+  348: 'Id.BoolUnary_a',
+  349: 'Id.BoolUnary_b',
+  350: 'Id.BoolUnary_c',
+  351: 'Id.BoolUnary_d',
+  352: 'Id.BoolUnary_e',
+  353: 'Id.BoolUnary_f',
+  354: 'Id.BoolUnary_g',
+  355: 'Id.BoolUnary_h',
+  356: 'Id.BoolUnary_k',
+  357: 'Id.BoolUnary_L',
+  358: 'Id.BoolUnary_p',
+  359: 'Id.BoolUnary_r',
+  360: 'Id.BoolUnary_s',
+  361: 'Id.BoolUnary_S',
+  362: 'Id.BoolUnary_u',
+  363: 'Id.BoolUnary_w',
+  364: 'Id.BoolUnary_x',
+  365: 'Id.BoolUnary_O',
+  366: 'Id.BoolUnary_G',
+  367: 'Id.BoolUnary_N',
+  368: 'Id.BoolBinary_GlobEqual',
+  369: 'Id.BoolBinary_GlobDEqual',
+  370: 'Id.BoolBinary_GlobNEqual',
+  371: 'Id.BoolBinary_EqualTilde',
+  372: 'Id.BoolBinary_ef',
+  373: 'Id.BoolBinary_nt',
+  374: 'Id.BoolBinary_ot',
+  375: 'Id.BoolBinary_eq',
+  376: 'Id.BoolBinary_ne',
+  377: 'Id.BoolBinary_gt',
+  378: 'Id.BoolBinary_ge',
+  379: 'Id.BoolBinary_lt',
+  380: 'Id.BoolBinary_le',
+  381: 'Id.BoolBinary_Equal',
+  382: 'Id.BoolBinary_DEqual',
+  383: 'Id.BoolBinary_NEqual',
+}
+
+def Id_str(val):
+  # type: (Id_t) -> str
+  return _Id_str[val]
+
+class Kind_t(pybase.SimpleObj):
+  pass
+
+class Kind(object):
+  Word = Kind_t(1)
+  Arith = Kind_t(2)
+  Eof = Kind_t(3)
+  Undefined = Kind_t(4)
+  Unknown = Kind_t(5)
+  Eol = Kind_t(6)
+  Ignored = Kind_t(7)
+  WS = Kind_t(8)
+  Lit = Kind_t(9)
+  Backtick = Kind_t(10)
+  History = Kind_t(11)
+  Op = Kind_t(12)
+  Expr = Kind_t(13)
+  Char = Kind_t(14)
+  Re = Kind_t(15)
+  Redir = Kind_t(16)
+  Left = Kind_t(17)
+  Right = Kind_t(18)
+  ExtGlob = Kind_t(19)
+  VSub = Kind_t(20)
+  VTest = Kind_t(21)
+  VOp0 = Kind_t(22)
+  VOp1 = Kind_t(23)
+  VOpOil = Kind_t(24)
+  VOp2 = Kind_t(25)
+  VOp3 = Kind_t(26)
+  Node = Kind_t(27)
+  KW = Kind_t(28)
+  ControlFlow = Kind_t(29)
+  LookAhead = Kind_t(30)
+  Glob = Kind_t(31)
+  Format = Kind_t(32)
+  PS = Kind_t(33)
+  Range = Kind_t(34)
+  QSN = Kind_t(35)
+  BoolUnary = Kind_t(36)
+  BoolBinary = Kind_t(37)
+
+_Kind_str = {
+  1: 'Kind.Word',
+  2: 'Kind.Arith',
+  3: 'Kind.Eof',
+  4: 'Kind.Undefined',
+  5: 'Kind.Unknown',
+  6: 'Kind.Eol',
+  7: 'Kind.Ignored',
+  8: 'Kind.WS',
+  9: 'Kind.Lit',
+  10: 'Kind.Backtick',
+  11: 'Kind.History',
+  12: 'Kind.Op',
+  13: 'Kind.Expr',
+  14: 'Kind.Char',
+  15: 'Kind.Re',
+  16: 'Kind.Redir',
+  17: 'Kind.Left',
+  18: 'Kind.Right',
+  19: 'Kind.ExtGlob',
+  20: 'Kind.VSub',
+  21: 'Kind.VTest',
+  22: 'Kind.VOp0',
+  23: 'Kind.VOp1',
+  24: 'Kind.VOpOil',
+  25: 'Kind.VOp2',
+  26: 'Kind.VOp3',
+  27: 'Kind.Node',
+  28: 'Kind.KW',
+  29: 'Kind.ControlFlow',
+  30: 'Kind.LookAhead',
+  31: 'Kind.Glob',
+  32: 'Kind.Format',
+  33: 'Kind.PS',
+  34: 'Kind.Range',
+  35: 'Kind.QSN',
+  36: 'Kind.BoolUnary',
+  37: 'Kind.BoolBinary',
+}
+
+def Kind_str(val):
+  # type: (Kind_t) -> str
+  return _Kind_str[val]
+
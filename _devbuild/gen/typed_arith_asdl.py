@@ -0,0 +1,556 @@
+from asdl import pybase
+from pylib.collections_ import OrderedDict
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
+
+class arith_expr_e(object):
+  NoOp = 1
+  Const = 2
+  Var = 3
+  Unary = 4
+  Binary = 5
+  Ternary = 6
+  FuncCall = 7
+  Index = 8
+  Slice = 9
+
+_arith_expr_str = {
+  1: 'arith_expr.NoOp',
+  2: 'arith_expr.Const',
+  3: 'arith_expr.Var',
+  4: 'arith_expr.Unary',
+  5: 'arith_expr.Binary',
+  6: 'arith_expr.Ternary',
+  7: 'arith_expr.FuncCall',
+  8: 'arith_expr.Index',
+  9: 'arith_expr.Slice',
+}
+
+def arith_expr_str(tag):
+  # type: (int) -> str
+  return _arith_expr_str[tag]
+
+class arith_expr_t(pybase.CompoundObj):
+  def tag(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class arith_expr__NoOp(arith_expr_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr__NoOp')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr__NoOp')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr(object):
+  NoOp = arith_expr__NoOp()
+  
+  class Const(arith_expr_t):
+    _type_tag = 2
+    __slots__ = ('i',)
+  
+    def __init__(self, i):
+      # type: (int) -> None
+      self.i = i
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.Const
+      return arith_expr.Const(-1)
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Const')
+      L = out_node.fields
+  
+      x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+      L.append(Field('i', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Const')
+      L = out_node.fields
+      x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+      L.append(Field('i', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Var(arith_expr_t):
+    _type_tag = 3
+    __slots__ = ('name',)
+  
+    def __init__(self, name):
+      # type: (str) -> None
+      self.name = name
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.Var
+      return arith_expr.Var('')
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Var')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x0))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Var')
+      L = out_node.fields
+      x0 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x0))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Unary(arith_expr_t):
+    _type_tag = 4
+    __slots__ = ('op', 'a')
+  
+    def __init__(self, op, a):
+      # type: (str, arith_expr_t) -> None
+      self.op = op
+      self.a = a
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.Unary
+      return arith_expr.Unary('', cast(arith_expr_t, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Unary')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.op, color_e.StringConst)
+      L.append(Field('op', x0))
+  
+      assert self.a is not None
+      x1 = self.a.PrettyTree()
+      L.append(Field('a', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Unary')
+      L = out_node.fields
+      x0 = NewLeaf(self.op, color_e.StringConst)
+      L.append(Field('op', x0))
+  
+      assert self.a is not None
+      x1 = self.a.AbbreviatedTree()
+      L.append(Field('a', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Binary(arith_expr_t):
+    _type_tag = 5
+    __slots__ = ('op', 'left', 'right')
+  
+    def __init__(self, op, left, right):
+      # type: (str, arith_expr_t, arith_expr_t) -> None
+      self.op = op
+      self.left = left
+      self.right = right
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.Binary
+      return arith_expr.Binary('', cast(arith_expr_t, None), cast(arith_expr_t,
+                               None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Binary')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.op, color_e.StringConst)
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.PrettyTree()
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.PrettyTree()
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Binary')
+      L = out_node.fields
+      x0 = NewLeaf(self.op, color_e.StringConst)
+      L.append(Field('op', x0))
+  
+      assert self.left is not None
+      x1 = self.left.AbbreviatedTree()
+      L.append(Field('left', x1))
+  
+      assert self.right is not None
+      x2 = self.right.AbbreviatedTree()
+      L.append(Field('right', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Ternary(arith_expr_t):
+    _type_tag = 6
+    __slots__ = ('cond', 'true_expr', 'false_expr')
+  
+    def __init__(self, cond, true_expr, false_expr):
+      # type: (arith_expr_t, arith_expr_t, arith_expr_t) -> None
+      self.cond = cond
+      self.true_expr = true_expr
+      self.false_expr = false_expr
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.Ternary
+      return arith_expr.Ternary(cast(arith_expr_t, None), cast(arith_expr_t,
+                                None), cast(arith_expr_t, None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Ternary')
+      L = out_node.fields
+  
+      assert self.cond is not None
+      x0 = self.cond.PrettyTree()
+      L.append(Field('cond', x0))
+  
+      assert self.true_expr is not None
+      x1 = self.true_expr.PrettyTree()
+      L.append(Field('true_expr', x1))
+  
+      assert self.false_expr is not None
+      x2 = self.false_expr.PrettyTree()
+      L.append(Field('false_expr', x2))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Ternary')
+      L = out_node.fields
+      assert self.cond is not None
+      x0 = self.cond.AbbreviatedTree()
+      L.append(Field('cond', x0))
+  
+      assert self.true_expr is not None
+      x1 = self.true_expr.AbbreviatedTree()
+      L.append(Field('true_expr', x1))
+  
+      assert self.false_expr is not None
+      x2 = self.false_expr.AbbreviatedTree()
+      L.append(Field('false_expr', x2))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class FuncCall(arith_expr_t):
+    _type_tag = 7
+    __slots__ = ('name', 'args')
+  
+    def __init__(self, name, args):
+      # type: (str, List[arith_expr_t]) -> None
+      self.name = name
+      self.args = args
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.FuncCall
+      return arith_expr.FuncCall('', [] if alloc_lists else
+                                 cast('List[arith_expr_t]', None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.FuncCall')
+      L = out_node.fields
+  
+      x0 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x0))
+  
+      if self.args is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.args:
+          x1.children.append(i1.PrettyTree())
+        L.append(Field('args', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.FuncCall')
+      L = out_node.fields
+      x0 = NewLeaf(self.name, color_e.StringConst)
+      L.append(Field('name', x0))
+  
+      if self.args is not None:  # List
+        x1 = hnode.Array([])
+        for i1 in self.args:
+          x1.children.append(i1.AbbreviatedTree())
+        L.append(Field('args', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Index(arith_expr_t):
+    _type_tag = 8
+    __slots__ = ('a', 'index')
+  
+    def __init__(self, a, index):
+      # type: (arith_expr_t, arith_expr_t) -> None
+      self.a = a
+      self.index = index
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.Index
+      return arith_expr.Index(cast(arith_expr_t, None), cast(arith_expr_t,
+                              None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Index')
+      L = out_node.fields
+  
+      assert self.a is not None
+      x0 = self.a.PrettyTree()
+      L.append(Field('a', x0))
+  
+      assert self.index is not None
+      x1 = self.index.PrettyTree()
+      L.append(Field('index', x1))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Index')
+      L = out_node.fields
+      assert self.a is not None
+      x0 = self.a.AbbreviatedTree()
+      L.append(Field('a', x0))
+  
+      assert self.index is not None
+      x1 = self.index.AbbreviatedTree()
+      L.append(Field('index', x1))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+  class Slice(arith_expr_t):
+    _type_tag = 9
+    __slots__ = ('a', 'begin', 'end', 'stride')
+  
+    def __init__(self, a, begin, end, stride):
+      # type: (arith_expr_t, Optional[arith_expr_t], Optional[arith_expr_t], Optional[arith_expr_t]) -> None
+      self.a = a
+      self.begin = begin
+      self.end = end
+      self.stride = stride
+  
+    @staticmethod
+    def CreateNull(alloc_lists=False):
+      # type: () -> arith_expr.Slice
+      return arith_expr.Slice(cast(arith_expr_t, None),
+                              cast('Optional[arith_expr_t]', None),
+                              cast('Optional[arith_expr_t]', None),
+                              cast('Optional[arith_expr_t]', None))
+  
+    def PrettyTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Slice')
+      L = out_node.fields
+  
+      assert self.a is not None
+      x0 = self.a.PrettyTree()
+      L.append(Field('a', x0))
+  
+      if self.begin is not None:  # Optional
+        x1 = self.begin.PrettyTree()
+        L.append(Field('begin', x1))
+  
+      if self.end is not None:  # Optional
+        x2 = self.end.PrettyTree()
+        L.append(Field('end', x2))
+  
+      if self.stride is not None:  # Optional
+        x3 = self.stride.PrettyTree()
+        L.append(Field('stride', x3))
+  
+      return out_node
+  
+    def _AbbreviatedTree(self):
+      # type: () -> hnode_t
+      out_node = NewRecord('arith_expr.Slice')
+      L = out_node.fields
+      assert self.a is not None
+      x0 = self.a.AbbreviatedTree()
+      L.append(Field('a', x0))
+  
+      if self.begin is not None:  # Optional
+        x1 = self.begin.AbbreviatedTree()
+        L.append(Field('begin', x1))
+  
+      if self.end is not None:  # Optional
+        x2 = self.end.AbbreviatedTree()
+        L.append(Field('end', x2))
+  
+      if self.stride is not None:  # Optional
+        x3 = self.stride.AbbreviatedTree()
+        L.append(Field('stride', x3))
+  
+      return out_node
+  
+    def AbbreviatedTree(self):
+      # type: () -> hnode_t
+      return self._AbbreviatedTree()
+  
+
+class pipeline(pybase.CompoundObj):
+  _type_tag = 64
+  __slots__ = ('negated',)
+
+  def __init__(self, negated):
+    # type: (bool) -> None
+    self.negated = negated
+
+  @staticmethod
+  def CreateNull(alloc_lists=False):
+    # type: () -> pipeline
+    return pipeline(False)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('pipeline')
+    L = out_node.fields
+
+    x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+    L.append(Field('negated', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('pipeline')
+    L = out_node.fields
+    x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+    L.append(Field('negated', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+#
+# CONCATENATED FILE
+#
+
+"""
+typed_arith_abbrev.py - Abbreviations for pretty-printing typed_arith.asdl.
+"""
+
+from asdl import runtime
+from _devbuild.gen.hnode_asdl import hnode
+
+def _arith_expr__Unary(obj):
+  # type: (arith_expr__Unary) -> hnode.Record
+
+  p_node = runtime.NewRecord('U')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.op), color_e.StringConst)
+  p_node.unnamed_fields.append(n)
+  p_node.unnamed_fields.append(obj.a.AbbreviatedTree())  # type: ignore
+  return p_node
+
+
+def _arith_expr__Binary(obj):
+  # type: (arith_expr__Binary) -> Optional[hnode.Record]
+
+  if obj.op == '=':  # test for fallback
+    return None
+
+  p_node = runtime.NewRecord('B')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.op), color_e.StringConst)
+  p_node.unnamed_fields.append(n)
+  p_node.unnamed_fields.append(obj.left.AbbreviatedTree())  # type: ignore
+  p_node.unnamed_fields.append(obj.right.AbbreviatedTree())  # type: ignore
+  return p_node
+
+
+def _arith_expr__Const(obj):
+  # type: (arith_expr__Const) -> hnode.Record
+  p_node = runtime.NewRecord('')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.i), color_e.OtherConst)
+  p_node.unnamed_fields.append(n)
+  return p_node
+
+
+def _arith_expr__Var(obj):
+  # type: (arith_expr__Var) -> hnode.Record
+  p_node = runtime.NewRecord('$')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.name), color_e.StringConst)
+  p_node.unnamed_fields.append(n)
+  return p_node
+
@@ -10,7 +10,9 @@ from __future__ import print_function
 import cStringIO
 from glob import glob
 import os
+import stat
 import sys
+import tempfile
 
 from build import ninja_lib
 from build.ninja_lib import log
@@ -33,6 +35,55 @@ from vendor import ninja_syntax
 BUILD_NINJA = 'build.ninja'
 
 
+def WriteIfChanged(path, contents, mode=None):
+  """Replace the file at path with contents, unless it's already identical.
+
+  Leaving an identical file alone preserves its mtime, so Ninja doesn't
+  consider everything dirty after a no-op regeneration.
+
+  Args:
+    mode: permission bits the file should have, e.g. 0o755.  If None, an
+      existing file keeps its bits.
+
+  Returns:
+    Whether the file was written.
+  """
+  try:
+    with open(path) as f:
+      old = f.read()
+    old_mode = stat.S_IMODE(os.stat(path).st_mode)
+  except (IOError, OSError):
+    old = None
+    old_mode = None
+
+  if old == contents and (mode is None or old_mode == mode):
+    return False
+
+  if mode is None:
+    if old_mode is None:
+      # New file: same permissions open() would have given it
+      umask = os.umask(0)
+      os.umask(umask)
+      mode = 0o666 & ~umask
+    else:
+      mode = old_mode
+
+  # Write to a unique temp file in the same dir and rename, so readers never
+  # see a partially written or non-executable file.  mkstemp() creates it
+  # with mode 0600, so always set the mode.
+  fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                             prefix=os.path.basename(path) + '.')
+  try:
+    with os.fdopen(fd, 'w') as f:
+      f.write(contents)
+      os.fchmod(f.fileno(), mode)
+    os.rename(tmp, path)
+  finally:
+    if os.path.exists(tmp):  # the write or rename failed
+      os.unlink(tmp)
+  return True
+
+
 def TarballManifest(cc_sources):
   names = []
 
@@ -319,10 +370,9 @@ def main(argv):
   except IndexError:
     action = 'ninja'
 
-  if action == 'ninja':
-    f = open(BUILD_NINJA, 'w')
-  else:
-    f = cStringIO.StringIO()  # thrown away
+  # Buffered so we can avoid touching BUILD_NINJA if nothing changed.  Thrown
+  # away for other actions.
+  f = cStringIO.StringIO()
 
   n = ninja_syntax.Writer(f)
   ru = ninja_lib.Rules(n)
@@ -383,14 +433,21 @@ def main(argv):
   n.default(['_bin/cxx-dbg/osh', '_bin/cxx-dbg/ysh'])
 
   if action == 'ninja':
-    log('  (%s) -> %s (%d targets)', argv[0], BUILD_NINJA,
-        n.num_build_targets())
+    if WriteIfChanged(BUILD_NINJA, f.getvalue()):
+      log('  (%s) -> %s (%d targets)', argv[0], BUILD_NINJA,
+          n.num_build_targets())
+    else:
+      log('  (%s) -> %s is up to date (%d targets)', argv[0], BUILD_NINJA,
+          n.num_build_targets())
 
   elif action == 'shell':
     out = '_build/oils.sh'
-    with open(out, 'w') as f:
-      ShellFunctions(cc_sources, f, argv[0])
-    log('  (%s) -> %s', argv[0], out)
+    buf = cStringIO.StringIO()
+    ShellFunctions(cc_sources, buf, argv[0])
+    if WriteIfChanged(out, buf.getvalue(), mode=0o755):
+      log('  (%s) -> %s', argv[0], out)
+    else:
+      log('  (%s) -> %s is up to date', argv[0], out)
 
   elif action == 'tarball-manifest':
     TarballManifest(cc_sources)
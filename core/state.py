@@ -71,6 +71,24 @@ class SearchPath(object):
         self.mem = mem
         self.cache = {}  # type: Dict[str, str]
 
+        # $PATH split on :, reused until $PATH changes
+        self.path_str = None  # type: Optional[str]
+        self.path_list = []  # type: List[str]
+
+    def _PathList(self):
+        # type: () -> List[str]
+        val = self.mem.GetValue('PATH')
+        UP_val = val
+        if val.tag() != value_e.Str:
+            no_path = []  # type: List[str]
+            return no_path  # treat as empty path
+
+        val = cast(value.Str, UP_val)
+        if self.path_str is None or val.s != self.path_str:
+            self.path_str = val.s
+            self.path_list = val.s.split(':')
+        return self.path_list
+
     def Lookup(self, name, exec_required=True):
         # type: (str, bool) -> Optional[str]
         """Returns the path itself (for relative path), the resolve path, or
@@ -81,17 +99,7 @@ class SearchPath(object):
             else:
                 return None
 
-        # TODO: Could cache this computation to avoid allocating every time for all
-        # the splitting.
-        val = self.mem.GetValue('PATH')
-        UP_val = val
-        if val.tag() == value_e.Str:
-            val = cast(value.Str, UP_val)
-            path_list = val.s.split(':')
-        else:
-            path_list = []  # treat as empty path
-
-        for path_dir in path_list:
+        for path_dir in self._PathList():
             full_path = os_path.join(path_dir, name)
 
             # NOTE: dash and bash only check for EXISTENCE in 'command -v' (and 'type
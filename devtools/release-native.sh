@@ -17,8 +17,8 @@ OIL_VERSION=$(head -n 1 oil-version.txt)
 readonly OIL_VERSION
 
 gen-oils-sh() {
+  # Also sets the executable bit
   PYTHONPATH=. build/ninja_main.py shell
-  chmod +x _build/oils.sh
 }
 
 make-tar() {
@@ -152,6 +152,12 @@ def LookupNormalBuiltin(argv0):
         return NO_INDEX
 
 
+def IsBuiltin(argv0):
+    # type: (str) -> bool
+    """Is it a builtin of any kind?"""
+    return argv0 in _BUILTIN_DICT
+
+
 def OptionName(opt_num):
     # type: (option_t) -> str
     """Get the name from an index."""
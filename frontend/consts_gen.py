@@ -339,6 +339,7 @@ option_asdl::option_t OptionNum(Str* s);
 option_asdl::builtin_t LookupNormalBuiltin(Str* s);
 option_asdl::builtin_t LookupAssignBuiltin(Str* s);
 option_asdl::builtin_t LookupSpecialBuiltin(Str* s);
+bool IsBuiltin(Str* s);
 bool IsControlFlow(Str* s);
 bool IsKeyword(Str* s);
 Str* LookupCharC(Str* c);
@@ -461,6 +462,7 @@ Kind GetKind(id_kind_asdl::Id_t id) {
             GenBuiltinLookup('LookupNormalBuiltin', 'normal', f)
             GenBuiltinLookup('LookupAssignBuiltin', 'assign', f)
             GenBuiltinLookup('LookupSpecialBuiltin', 'special', f)
+            GenStringMembership('IsBuiltin', consts.BUILTIN_NAMES, f)
 
             from frontend import lexer_def  # break circular dep
             GenStringMembership('IsControlFlow', lexer_def.CONTROL_FLOW_NAMES,
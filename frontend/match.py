@@ -158,8 +158,9 @@ else:
     #QSN_MATCHER = _MatchTokenSlow(lexer_def.QSN_DEF)
 
     # Used by osh/cmd_parse.py to validate for loop name.  Note it must be
-    # anchored on the right.
-    _VAR_NAME_RE = re.compile(lexer_def.VAR_NAME_RE + '$')  # type: ignore
+    # anchored on the right.  \Z rather than $, which would also match before
+    # a trailing newline, unlike fastlex.IsValidVarName.
+    _VAR_NAME_RE = re.compile(lexer_def.VAR_NAME_RE + r'\Z')  # type: ignore
 
     def IsValidVarName(s):
         # type: (str) -> bool
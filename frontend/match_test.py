@@ -31,6 +31,16 @@ class MatchTest(unittest.TestCase):
         # fastlex bug: should not allow \0
         self.assertEqual(False, match.ShouldHijack('#!/usr/bin/env \0 sh\n'))
 
+    def testIsValidVarName(self):
+        self.assertEqual(True, match.IsValidVarName('abc'))
+        self.assertEqual(True, match.IsValidVarName('_foo9'))
+
+        self.assertEqual(False, match.IsValidVarName(''))
+        self.assertEqual(False, match.IsValidVarName('9x'))
+        self.assertEqual(False, match.IsValidVarName('x-'))
+        # Must be anchored at the very end
+        self.assertEqual(False, match.IsValidVarName('abc\n'))
+
     def testBraceRangeLexer(self):
         lex = match.BraceRangeLexer('1..3')
         while True:
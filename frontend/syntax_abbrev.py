@@ -37,8 +37,9 @@ def _CompoundWord(obj):
     p_node.left = '{'
     p_node.right = '}'
 
+    out = p_node.unnamed_fields
     for part in obj.parts:
-        p_node.unnamed_fields.append(part.AbbreviatedTree())
+        out.append(part.AbbreviatedTree())
     return p_node
 
 
@@ -50,8 +51,9 @@ def _DoubleQuoted(obj):
     p_node = runtime.NewRecord('DQ')
     p_node.abbrev = True
 
+    out = p_node.unnamed_fields
     for part in obj.parts:
-        p_node.unnamed_fields.append(part.AbbreviatedTree())
+        out.append(part.AbbreviatedTree())
     return p_node
 
 
@@ -65,8 +67,9 @@ def _SingleQuoted(obj):
     p_node = runtime.NewRecord('SQ')
     p_node.abbrev = True
 
+    out = p_node.unnamed_fields
     for token in obj.tokens:
-        p_node.unnamed_fields.append(token.AbbreviatedTree())
+        out.append(token.AbbreviatedTree())
     return p_node
 
 
@@ -75,22 +78,23 @@ def _SimpleVarSub(obj):
     p_node = runtime.NewRecord('$')
     p_node.abbrev = True
 
+    out = p_node.unnamed_fields
     if obj.left.id != Id.VSub_Name:
         n1 = runtime.NewLeaf(Id_str(obj.left.id), color_e.OtherConst)
-        p_node.unnamed_fields.append(n1)
+        out.append(n1)
 
     n2 = runtime.NewLeaf(obj.var_name, color_e.StringConst)
-    p_node.unnamed_fields.append(n2)
+    out.append(n2)
 
     return p_node
 
 
 def _BracedVarSub(obj):
     # type: (BracedVarSub) -> hnode_t
-    p_node = runtime.NewRecord('${')
     if obj.prefix_op or obj.bracket_op or obj.suffix_op:
         return None  # we have other fields to display; don't abbreviate
 
+    p_node = runtime.NewRecord('${')
     p_node.abbrev = True
     _AbbreviateToken(obj.token, p_node.unnamed_fields)
     return p_node
@@ -98,15 +102,17 @@ def _BracedVarSub(obj):
 
 def _command__Simple(obj):
     # type: (command.Simple) -> hnode_t
-    p_node = runtime.NewRecord('C')
-    if (obj.redirects or obj.more_env or obj.typed_args or obj.block or
-            obj.do_fork == False):
+    # do_fork is a plain bool, so test it first; it's rarely False
+    if (not obj.do_fork or obj.redirects or obj.more_env or obj.typed_args or
+            obj.block):
         return None  # we have other fields to display; don't abbreviate
 
+    p_node = runtime.NewRecord('C')
     p_node.abbrev = True
 
+    out = p_node.unnamed_fields
     for w in obj.words:
-        p_node.unnamed_fields.append(w.AbbreviatedTree())
+        out.append(w.AbbreviatedTree())
     return p_node
 
 
@@ -62,6 +62,11 @@ class BoolParser(object):
         self.bool_id = Id.Undefined_Tok
         self.bool_kind = Kind.Undefined
 
+        # Same as above, but for the lookahead word.  Reused by _NextOne()
+        # instead of being computed again.
+        self.la_bool_id = Id.Undefined_Tok
+        self.la_bool_kind = Kind.Undefined
+
     def _NextOne(self, lex_mode=lex_mode_e.DBracket):
         # type: (lex_mode_t) -> None
         n = len(self.words)
@@ -70,6 +75,11 @@ class BoolParser(object):
             self.words[0] = self.words[1]
             self.cur_word = self.words[0]
             self.words.pop()
+
+            # Computed by _LookAhead()
+            self.bool_id = self.la_bool_id
+            self.bool_kind = self.la_bool_kind
+
         elif n in (0, 1):
             w = self.w_parser.ReadWord(lex_mode)  # may raise
             if n == 0:
@@ -78,9 +88,10 @@ class BoolParser(object):
                 self.words[0] = w
             self.cur_word = w
 
+            self.bool_id = word_.BoolId(w)
+            self.bool_kind = consts.GetKind(self.bool_id)
+
         assert self.cur_word is not None
-        self.bool_id = word_.BoolId(self.cur_word)
-        self.bool_kind = consts.GetKind(self.bool_id)
         #log('--- word %s', self.cur_word)
         #log('bool_id %s %s %s', Id_str(self.bool_id), Kind_str(self.bool_kind), lex_mode)
 
@@ -99,14 +110,17 @@ class BoolParser(object):
                 break
 
     def _LookAhead(self):
-        # type: () -> word_t
+        # type: () -> None
+        """Read the next word, setting la_bool_id and la_bool_kind."""
         n = len(self.words)
         if n != 1:
             raise AssertionError(n)
 
         w = self.w_parser.ReadWord(lex_mode_e.DBracket)  # may raise
         self.words.append(w)  # Save it for _Next()
-        return w
+
+        self.la_bool_id = word_.BoolId(w)
+        self.la_bool_kind = consts.GetKind(self.la_bool_id)
 
     def Parse(self):
         # type: () -> Tuple[bool_expr_t, Token]
@@ -148,34 +162,31 @@ class BoolParser(object):
         Iterative:
         Expr    : Term (OR Term)*
 
-        Right recursion:
-        Expr    : Term (OR Expr)?
+        Builds a left-leaning tree, so a long chain doesn't use one Python
+        stack frame per operator.  || is associative, so the result is the
+        same.
         """
         left = self.ParseTerm()
         # [[ uses || but [ uses -o
-        if self.bool_id in (Id.Op_DPipe, Id.BoolUnary_o):
+        while self.bool_id in (Id.Op_DPipe, Id.BoolUnary_o):
             self._Next()
-            right = self.ParseExpr()
-            return bool_expr.LogicalOr(left, right)
-        else:
-            return left
+            right = self.ParseTerm()
+            left = bool_expr.LogicalOr(left, right)
+        return left
 
     def ParseTerm(self):
         # type: () -> bool_expr_t
         """
+        Iterative:
         Term    : Negated (AND Negated)*
-
-        Right recursion:
-        Term    : Negated (AND Term)?
         """
         left = self.ParseNegatedFactor()
         # [[ uses && but [ uses -a
-        if self.bool_id in (Id.Op_DAmp, Id.BoolUnary_a):
+        while self.bool_id in (Id.Op_DAmp, Id.BoolUnary_a):
             self._Next()
-            right = self.ParseTerm()
-            return bool_expr.LogicalAnd(left, right)
-        else:
-            return left
+            right = self.ParseNegatedFactor()
+            left = bool_expr.LogicalAnd(left, right)
+        return left
 
     def ParseNegatedFactor(self):
         # type: () -> bool_expr_t
@@ -218,11 +229,11 @@ class BoolParser(object):
 
         if self.bool_kind == Kind.Word:
             # Peek ahead another token.
-            t2 = self._LookAhead()
-            t2_bool_id = word_.BoolId(t2)
-            t2_bool_kind = consts.GetKind(t2_bool_id)
+            self._LookAhead()
+            t2_bool_id = self.la_bool_id
+            t2_bool_kind = self.la_bool_kind
 
-            #log('t2 %s / t2_bool_id %s / t2_bool_kind %s', t2, t2_bool_id, t2_bool_kind)
+            #log('t2_bool_id %s / t2_bool_kind %s', t2_bool_id, t2_bool_kind)
             # Op for < and >, -a and -o pun
             if t2_bool_kind == Kind.BoolBinary or t2_bool_id in (Id.Op_Less,
                                                                  Id.Op_Great):
@@ -103,6 +103,22 @@ class BoolParserTest(unittest.TestCase):
         p = _MakeParser('a == b')
         print(p.ParseExpr())
 
+        # Chains are left-leaning
+        p = _MakeParser('a || b || c')
+        node = p.ParseExpr()
+        print(node)
+        self.assertEqual(bool_expr_e.LogicalOr, node.tag())
+        self.assertEqual(bool_expr_e.LogicalOr, node.left.tag())
+        self.assertEqual(bool_expr_e.WordTest, node.right.tag())
+
+        # && binds more tightly than ||
+        p = _MakeParser('a || b && c')
+        node = p.ParseExpr()
+        print(node)
+        self.assertEqual(bool_expr_e.LogicalOr, node.tag())
+        self.assertEqual(bool_expr_e.WordTest, node.left.tag())
+        self.assertEqual(bool_expr_e.LogicalAnd, node.right.tag())
+
     def testParseFactorInParens(self):
         p = _MakeParser('( foo == bar )')
         node = p.ParseFactor()
@@ -412,12 +412,7 @@ def _ResolveNames(names, funcs, aliases, search_path):
         elif name in aliases:
             kind = ('alias', name)
 
-        # TODO: Use match instead?
-        elif consts.LookupNormalBuiltin(name) != 0:
-            kind = ('builtin', name)
-        elif consts.LookupSpecialBuiltin(name) != 0:
-            kind = ('builtin', name)
-        elif consts.LookupAssignBuiltin(name) != 0:
+        elif consts.IsBuiltin(name):  # normal, special, and assignment
             kind = ('builtin', name)
         elif consts.IsControlFlow(name):  # continue, etc.
             kind = ('keyword', name)
@@ -533,6 +533,12 @@ class Echo(vm._Builtin):
         if arg.e:
             new_argv = []  # type: List[str]
             for a in argv:
+                # Common case: no escapes to process, so skip the lexer.  The
+                # lexer also stops at NUL, so those args still go through it.
+                if '\\' not in a and '\0' not in a:
+                    new_argv.append(a)
+                    continue
+
                 parts = []  # type: List[str]
                 lex = match.EchoLexer(a)
                 while not backslash_c:
@@ -560,10 +566,7 @@ class Echo(vm._Builtin):
             argv = new_argv
 
         #log('echo argv %s', argv)
-        for i, a in enumerate(argv):
-            if i != 0:
-                self.f.write(' ')  # arg separator
-            self.f.write(a)
+        self.f.write(' '.join(argv))
 
         if not arg.n and not backslash_c:
             self.f.write('\n')
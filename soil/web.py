@@ -36,12 +36,11 @@ How to test changes to this file:
 """
 from __future__ import print_function
 
+import bisect
+import cgi
 import collections
-import csv
 import datetime
 import json
-import itertools
-import os
 import re
 import sys
 from doctools import html_head
@@ -60,6 +59,21 @@ def log(msg, *args):
 
 SECS_IN_DAY = 86400
 
+# (upper bound on delta, format, unit to divide delta by), sorted by bound
+_PRETTY_TIME = [
+    (10, 'just now', 0),
+    (60, '%d seconds ago', 1),
+    (120, 'a minute ago', 0),
+    (3600, '%d minutes ago', 60),
+    (7200, 'an hour ago', 0),
+    (SECS_IN_DAY, '%d hours ago', 3600),
+    (2 * SECS_IN_DAY, 'Yesterday', 0),
+    (7 * SECS_IN_DAY, '%d days ago', SECS_IN_DAY),
+    (31 * SECS_IN_DAY, '%d weeks ago', 7 * SECS_IN_DAY),
+    (365 * SECS_IN_DAY, '%d months ago', 30 * SECS_IN_DAY),
+]
+_PRETTY_TIME_BOUNDS = [bound for bound, _, _ in _PRETTY_TIME]
+
 
 def PrettyTime(now, start_time):
   """
@@ -68,41 +82,23 @@ def PrettyTime(now, start_time):
   """
   delta = now - start_time
 
-  if delta < 10:
-      return "just now"
-  if delta < 60:
-      return "%d seconds ago" % delta
-  if delta < 120:
-      return "a minute ago"
-  if delta < 3600:
-      return "%d minutes ago" % (delta // 60)
-  if delta < 7200:
-      return "an hour ago"
-  if delta < SECS_IN_DAY:
-      return "%d hours ago" % (delta // 3600)
-
-  if delta < 2 * SECS_IN_DAY:
-      return "Yesterday"
-  if delta < 7 * SECS_IN_DAY:
-      return "%d days ago" % (delta // SECS_IN_DAY)
-
-  if day_diff < 31 * SECS_IN_DAY:
-      return "%d weeks ago" % (delta / SECS_IN_DAY / 7)
-
-  if day_diff < 365:
-      return "%d months ago" % (delta / SECS_IN_DAY / 30) 
+  i = bisect.bisect_right(_PRETTY_TIME_BOUNDS, delta)
+  if i == len(_PRETTY_TIME):
+    return '%d years ago' % (delta // (365 * SECS_IN_DAY))
 
-  return "%d years ago" % (delta / SECS_IN_DAY / 365)
+  _, fmt, unit = _PRETTY_TIME[i]
+  if unit == 0:
+    return fmt
+  return fmt % (delta // unit)
 
 
 def _MinutesSeconds(num_seconds):
-  num_seconds = round(num_seconds)  # round to integer
-  minutes = num_seconds / 60
-  seconds = num_seconds % 60
-  return '%d:%02d' % (minutes, seconds)
+  # Round to integer.  Same as round() for the non-negative times we get.
+  n = int(num_seconds + 0.5)
+  return '%d:%02d' % divmod(n, 60)
 
 
-LINE_RE = re.compile(r'(\w+)[ ]+([\d.]+)')
+REAL_RE = re.compile(r'^real[ ]+([\d.]+)', re.MULTILINE)
 
 def _ParsePullTime(time_p_str):
   """
@@ -114,12 +110,9 @@ def _ParsePullTime(time_p_str):
 
   Return the real time as a string, or - if we don't know it.
   """
-  for line in time_p_str.splitlines():
-    m = LINE_RE.match(line)
-    if m:
-      name, value = m.groups()
-      if name == 'real':
-        return _MinutesSeconds(float(value))
+  m = REAL_RE.search(time_p_str)
+  if m:
+    return _MinutesSeconds(float(m.group(1)))
 
   return '-'  # Not found
 
@@ -229,6 +222,23 @@ DETAILS_TABLE_T = jsontemplate.Template('''\
 ''')
 
 
+# minute -> formatted string.  Jobs in the same run usually start within the
+# same minute, so most lookups hit.
+_START_TIME_CACHE = {}
+
+def _StartTimeStr(start_time):
+  # The format only has minute resolution, so cache by minute
+  minute = start_time // 60
+  s = _START_TIME_CACHE.get(minute)
+  if s is None:
+    t = datetime.datetime.fromtimestamp(minute * 60)
+    # %-I avoids leading 0, and is 12 hour date.
+    # lower() for 'pm' instead of 'PM'.
+    s = t.strftime('%-m/%d at %-I:%M%p').lower()
+    _START_TIME_CACHE[minute] = s
+  return s
+
+
 def ParseJobs(stdin):
   """
   Given the output of list-json, open JSON and corresponding TSV, and yield a
@@ -252,10 +262,11 @@ def ParseJobs(stdin):
     total_elapsed = 0.0
 
     with open(tsv_path) as f:
-      reader = csv.reader(f, delimiter='\t')
-
+      # The TSV has no quoting, so a plain split is enough, and faster than
+      # csv.reader
       try:
-        for row in reader:
+        for tsv_line in f:
+          row = tsv_line.rstrip('\n').split('\t')
           t = {}
           # Unpack, matching _tmp/soil/INDEX.tsv
           ( status, elapsed,
@@ -302,11 +313,13 @@ def ParseJobs(stdin):
 
     meta['run_time_str'] = _MinutesSeconds(total_elapsed)
 
-    pull_time = meta.get('image-pull-time')
+    get = meta.get  # bind once; it's called many times below
+
+    pull_time = get('image-pull-time')
     if pull_time is not None:
       meta['pull_time_str'] = _ParsePullTime(pull_time)
 
-    start_time = meta.get('task-run-start-time')
+    start_time = get('task-run-start-time')
     if start_time is None:
       start_time_str = '?'
     else:
@@ -315,10 +328,7 @@ def ParseJobs(stdin):
       #now = time.time()
       start_time = int(start_time)
 
-      t = datetime.datetime.fromtimestamp(start_time)
-      # %-I avoids leading 0, and is 12 hour date.
-      # lower() for 'pm' instead of 'PM'.
-      start_time_str = t.strftime('%-m/%d at %-I:%M%p').lower()
+      start_time_str = _StartTimeStr(start_time)
 
       #start_time_str = PrettyTime(now, start_time)
 
@@ -327,11 +337,11 @@ def ParseJobs(stdin):
     # Metadata for a "run".  A run is for a single commit, and consists of many
     # jobs.
 
-    meta['git-branch'] = meta.get('GITHUB_REF')
+    meta['git-branch'] = get('GITHUB_REF')
 
     # Show the branch ref/heads/soil-staging or ref/pull/1577/merge (linkified)
-    pr_head_ref = meta.get('GITHUB_PR_HEAD_REF')
-    pr_number = meta.get('GITHUB_PR_NUMBER')
+    pr_head_ref = get('GITHUB_PR_HEAD_REF')
+    pr_number = get('GITHUB_PR_NUMBER')
 
     if pr_head_ref and pr_number:
       meta['github-pr'] = {
@@ -340,26 +350,26 @@ def ParseJobs(stdin):
           }
 
       # Show the user's commit, not the merge commit
-      commit_hash = meta.get('GITHUB_PR_HEAD_SHA') or '?'
+      commit_hash = get('GITHUB_PR_HEAD_SHA') or '?'
 
     else:
       # From soil/worker.sh save-metadata.  This is intended to be
       # CI-independent, while the environment variables above are from Github.
-      meta['commit-desc'] = meta.get('commit-line', '?')
-      commit_hash = meta.get('commit-hash') or '?'
+      meta['commit-desc'] = get('commit-line', '?')
+      commit_hash = get('commit-hash') or '?'
 
     commit_link = {
         'commit-hash': commit_hash,
         'commit-hash-short': commit_hash[:8],
         }
 
-    meta['job-name'] = meta.get('job-name') or '?'
+    meta['job-name'] = get('job-name') or '?'
 
     # Metadata for "Job"
 
     # GITHUB_RUN_NUMBER (project-scoped) is shorter than GITHUB_RUN_ID (global
     # scope)
-    github_run = meta.get('GITHUB_RUN_NUMBER')
+    github_run = get('GITHUB_RUN_NUMBER')
 
     if github_run:
       meta['job_num'] = github_run
@@ -380,10 +390,11 @@ def ParseJobs(stdin):
       run_url_prefix = '../%s/' % sourcehut_job_id
 
     # For Github, we construct $JOB_URL in soil/github-actions.sh
-    meta['job_url'] = meta.get('JOB_URL') or '?'
+    meta['job_url'] = get('JOB_URL') or '?'
 
-    prefix, _ = os.path.splitext(json_path)  # x/y/123/myjob
-    parts = prefix.split('/')
+    # x/y/123/myjob.json -> ['x/y', '123', 'myjob'].  Only the last two parts
+    # are used.
+    parts = json_path[:-5].rsplit('/', 2)
 
     # Paths relative to github-jobs/1234/
     meta['run_wwz_path'] = run_url_prefix + parts[-1] + '.wwz'  # myjob.wwz
@@ -397,7 +408,7 @@ def ParseJobs(stdin):
     yield meta
 
 
-HTML_BODY_TOP_T = jsontemplate.Template('''
+HTML_BODY_TOP = '''
   <body class="width50">
     <p id="home-link">
         <a href="..">Up</a>
@@ -405,8 +416,8 @@ HTML_BODY_TOP_T = jsontemplate.Template('''
       | <a href="//oilshell.org/">oilshell.org</a>
     </p>
 
-    <h1>{title|html}</h1>
-''')
+    <h1>%s</h1>
+'''
 
 HTML_BODY_BOTTOM = '''\
   </body>
@@ -423,7 +434,7 @@ INDEX_HEADER = '''\
   </thead>
 '''
 
-INDEX_RUN_ROW_T = jsontemplate.Template('''\
+INDEX_RUN_ROW = '''\
 <tr class="spacer">
   <td colspan=2></td>
 </tr>
@@ -464,9 +475,9 @@ INDEX_RUN_ROW_T = jsontemplate.Template('''\
 <tr class="spacer">
   <td colspan=2><td/>
 </tr>
-''')
+'''
 
-INDEX_JOBS_T = jsontemplate.Template('''\
+INDEX_JOBS = '''\
 <tr>
   <td>
   </td>
@@ -526,7 +537,14 @@ INDEX_JOBS_T = jsontemplate.Template('''\
   <td colspan=3> &nbsp; </td>
 </tr>
 
-''')
+'''
+
+INDEX_RUNS_T = jsontemplate.Template(
+    '{.repeated section runs}\n' +
+    '{.section run}\n' + INDEX_RUN_ROW + '\n{.end}\n' +
+    INDEX_JOBS + '\n' +
+    '{.end}\n')
+
 
 def PrintIndexHtml(title, groups, f=sys.stdout):
   # Bust cache (e.g. Safari iPad seems to cache aggressively and doesn't
@@ -534,17 +552,17 @@ def PrintIndexHtml(title, groups, f=sys.stdout):
   html_head.Write(f, title,
       css_urls=['../web/base.css?cache=0', '../web/soil.css?cache=0'])
 
-  d = {'title': title}
-  print(HTML_BODY_TOP_T.expand(d), file=f)
+  out = []
 
-  print(INDEX_HEADER, file=f)
-
-  for key, jobs in groups.iteritems():
-    # All jobs have run-level metadata, so just use the first
+  out.append(HTML_BODY_TOP % cgi.escape(title))
 
-    print(INDEX_RUN_ROW_T.expand(jobs[0]), file=f)
+  out.append(INDEX_HEADER)
 
+  runs = []
+  for key, jobs in groups.iteritems():
     summary = {
+        # All jobs have run-level metadata, so just use the first
+        'run': jobs[0],
         'jobs-passed': [],
         'jobs-failed': [],
         'index_run_url': jobs[0]['index_run_url'],
@@ -556,10 +574,14 @@ def PrintIndexHtml(title, groups, f=sys.stdout):
       else:
         summary['jobs-failed'].append(job)
 
-    print(INDEX_JOBS_T.expand(summary), file=f)
+    runs.append(summary)
+
+  out.append(INDEX_RUNS_T.expand({'runs': runs}))
+
+  out.append(' </table>')
+  out.append(HTML_BODY_BOTTOM)
 
-  print(' </table>', file=f)
-  print(HTML_BODY_BOTTOM, file=f)
+  f.write('\n'.join(out) + '\n')
 
 
 TASK_TABLE_T = jsontemplate.Template('''\
@@ -648,33 +670,39 @@ def PrintRunHtml(title, jobs, f=sys.stdout):
   html_head.Write(f, title,
       css_urls=['../../web/base.css?cache=0', '../../web/soil.css?cache=0'])
 
-  d = {'title': title}
-  print(HTML_BODY_TOP_T.expand(d), file=f)
+  out = []
 
-  print(DETAILS_RUN_T.expand(jobs[0]), file=f)
+  out.append(HTML_BODY_TOP % cgi.escape(title))
+
+  out.append(DETAILS_RUN_T.expand(jobs[0]))
 
   d2 = {'jobs': jobs}
-  print(DETAILS_TABLE_T.expand(d2), file=f)
+  out.append(DETAILS_TABLE_T.expand(d2))
+
+  out.append(TASK_TABLE_T.expand(d2))
 
-  print(TASK_TABLE_T.expand(d2), file=f)
+  out.append(HTML_BODY_BOTTOM)
 
-  print(HTML_BODY_BOTTOM, file=f)
+  f.write('\n'.join(out) + '\n')
 
 
 def GroupJobs(jobs, key_func):
   """
-  Expands groupby result into a simple dict
-  """
-  groups = itertools.groupby(jobs, key=key_func)
+  Bucket jobs into a dict by key_func, in one pass.
 
+  Keys are ordered by where they first appear in jobs, so callers sort jobs
+  to order the groups.  Unlike itertools.groupby(), jobs with the same key
+  don't need to be adjacent.
+  """
+  # OrderedDict because this runs under Python 2, where dict order is
+  # arbitrary.  On Python 3.7+ a plain dict would do.
   d = collections.OrderedDict()
 
-  for key, job_iter in groups:
-    jobs = list(job_iter)
+  for job in jobs:
+    d.setdefault(key_func(job), []).append(job)
 
-    jobs.sort(key=ByTaskRunStartTime, reverse=True)
-
-    d[key] = jobs
+  for group in d.itervalues():
+    group.sort(key=ByTaskRunStartTime, reverse=True)
 
   return d
 
@@ -707,14 +735,12 @@ def main(argv):
     assert run_id.startswith('git-'), run_id
     commit_hash = run_id[4:]
 
-    jobs = list(ParseJobs(sys.stdin))
-
     # sourcehut doesn't have a build number.
     # - Sort by descnding commit date.  (Minor problem: Committing on a VM with
     #   bad clock can cause commits "in the past")
     # - Group by commit HASH, because 'git rebase' can crate different commits
     #   with the same date.
-    jobs.sort(key=ByCommitDate, reverse=True)
+    jobs = sorted(ParseJobs(sys.stdin), key=ByCommitDate, reverse=True)
     groups = GroupJobs(jobs, ByCommitHash)
 
     title = 'Recent Jobs (sourcehut)'
@@ -732,9 +758,8 @@ def main(argv):
     run_index_out = argv[3]
     run_id = int(argv[4])  # compared as an integer
 
-    jobs = list(ParseJobs(sys.stdin))
-
-    jobs.sort(key=ByGithubRun, reverse=True)  # ordered
+    # ordered
+    jobs = sorted(ParseJobs(sys.stdin), key=ByGithubRun, reverse=True)
     groups = GroupJobs(jobs, ByGithubRun)
 
     title = 'Recent Jobs (Github Actions)'
@@ -772,7 +797,8 @@ def main(argv):
     # Sort by 999 here
     # travis-ci.oilshell.org/github-jobs/999/foo.json
 
-    prefixes.sort(key = lambda path: int(path.split('/')[-2]))
+    # key= computes each key once; rsplit() because only the run number matters
+    prefixes.sort(key=lambda path: int(path.rsplit('/', 2)[-2]))
 
     prefixes = prefixes[:-num_to_keep]
 
@@ -4,6 +4,7 @@ web_test.py: Tests for web.py
 """
 from __future__ import print_function
 
+import cgi
 import itertools
 import unittest
 
@@ -15,8 +16,33 @@ class WebTest(unittest.TestCase):
   def testParse(self):
     print(web._ParsePullTime('real 19.99'))
 
+    self.assertEqual('0:20', web._ParsePullTime('real 19.99'))
+    self.assertEqual('1:01', web._ParsePullTime('user 0.02\nreal 61.0\nsys 0.02'))
+    self.assertEqual('-', web._ParsePullTime('user 0.02\nsys 0.02'))
+
+  def testPrettyTime(self):
+    now = 1000000000
+    day = web.SECS_IN_DAY
+    for delta, expected in [
+        (-5, 'just now'),
+        (9, 'just now'),
+        (10, '10 seconds ago'),
+        (90, 'a minute ago'),
+        (125, '2 minutes ago'),
+        (3600, 'an hour ago'),
+        (5 * 3600, '5 hours ago'),
+        (day + 1, 'Yesterday'),
+        (3 * day, '3 days ago'),
+        (15 * day, '2 weeks ago'),
+        (65 * day, '2 months ago'),
+        (800 * day, '2 years ago'),
+        ]:
+      self.assertEqual(expected, web.PrettyTime(now, now - delta))
+
   def testTemplates(self):
-    print(web.HTML_BODY_TOP_T.expand({'title': 'title & other'}))
+    s = web.HTML_BODY_TOP % cgi.escape('title & other')
+    print(s)
+    self.assertIn('<h1>title &amp; other</h1>', s)
 
     job = {
         'job_num': '123',
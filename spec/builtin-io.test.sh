@@ -97,6 +97,19 @@ echo -e 'ab\0cd'
 ## stdout-json: "ab\u0000cd\n"
 ## N-I dash stdout-json: "-e ab\u0000cd\n"
 
+#### echo -e stops at NUL in an argument
+x=$'a\x00b'
+echo -e "$x"
+echo -e "$x" 'c\td'
+## STDOUT:
+a
+a c	d
+## END
+## N-I dash STDOUT:
+-e $a\x00b
+-e $a\x00b c	d
+## END
+
 #### \c stops processing input
 flags='-e'
 case $SH in dash) flags='' ;; esac